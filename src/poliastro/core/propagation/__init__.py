@@ -36,6 +36,7 @@ __all__ = [
 ]
 
 
+@jit
 def func_twobody(t0, u_, k):
     """Differential equation for the initial value two body problem.
 
@@ -52,9 +53,10 @@ def func_twobody(t0, u_, k):
 
     """
     x, y, z, vx, vy, vz = u_
-    r3 = (x ** 2 + y ** 2 + z ** 2) ** 1.5
+    r = (x * x + y * y + z * z) ** 0.5
+    k_r3 = k / (r * r * r)
 
-    du = np.array([vx, vy, vz, -k * x / r3, -k * y / r3, -k * z / r3])
+    du = np.array([vx, vy, vz, -k_r3 * x, -k_r3 * y, -k_r3 * z])
     return du
 
 
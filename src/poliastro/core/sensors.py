@@ -2,7 +2,7 @@ import numpy as np
 from numba import njit as jit
 
 
-@jit
+@jit(cache=True)
 def min_and_max_ground_range(h, η_fov, η_center, R):
     """Calculates the minimum and maximum values of ground-range angles.
 
@@ -50,7 +50,7 @@ def min_and_max_ground_range(h, η_fov, η_center, R):
     return Λ_min, Λ_max
 
 
-@jit
+@jit(cache=True)
 def ground_range_diff_at_azimuth(h, η_fov, η_center, β, φ_nadir, λ_nadir, R):
     """Calculates the difference in ground-range angles from the η_center angle and the latitude and longitude of the target
     for a desired phase angle, β, used to specify where the sensor is looking.
@@ -106,11 +106,12 @@ class EarthSatellite:
             }
 
         def f(t0, state, k):
-            du_kep = func_twobody(t0, state, k)
+            du = func_twobody(t0, state, k)
             ax, ay, az = ad(t0, state, k, perturbations)
-            du_ad = np.array([0, 0, 0, ax, ay, az])
-
-            return du_kep + du_ad
+            du[3] += ax
+            du[4] += ay
+            du[5] += az
+            return du
 
         ad_kwargs.update(perturbations=perturbations)
         new_orbit = self.orbit.propagate(value=tof, method=cowell, f=f)
@@ -6,7 +6,6 @@ from poliastro.core.sensors import (
 )
 
 
-@u.quantity_input(h=u.au, eta_fov=u.rad, eta_center=u.rad, R=u.au)
 def min_and_max_ground_range(h, eta_fov, eta_center, R):
     """
     Calculates the minimum and maximum values of ground-range angles.
@@ -29,25 +28,20 @@ def min_and_max_ground_range(h, eta_fov, eta_center, R):
     lambda_max: ~astropy.units.Quantity
         Maximum value of latitude and longitude.
 
+    Notes
+    -----
+    Plain numbers raise ``AttributeError`` and wrong units ``UnitConversionError``.
+
     """
-    h = h.to(u.au).value
-    eta_fov = eta_fov.to(u.rad).value
-    eta_center = eta_center.to(u.rad).value
-    R = R.to(u.au).value
+    h = h.to_value(u.au)
+    eta_fov = eta_fov.to_value(u.rad)
+    eta_center = eta_center.to_value(u.rad)
+    R = R.to_value(u.au)
     lambda_min, lambda_max = min_and_max_ground_range_fast(h, eta_fov, eta_center, R)
 
-    return lambda_min * u.rad, lambda_max * u.rad
+    return lambda_min << u.rad, lambda_max << u.rad
 
 
-@u.quantity_input(
-    h=u.au,
-    eta_fov=u.rad,
-    eta_center=u.rad,
-    beta=u.rad,
-    phi_nadir=u.rad,
-    lambda_nadir=u.rad,
-    R=u.au,
-)
 def ground_range_diff_at_azimuth(
     h, eta_fov, eta_center, beta, phi_nadir, lambda_nadir, R
 ):
@@ -87,17 +81,21 @@ def ground_range_diff_at_azimuth(
         This formula always gives the answer for the short way to the target ot the acute angle, β,
         which must be greater than 0º and less than 180º.
 
+    Notes
+    -----
+    Plain numbers raise ``AttributeError`` and wrong units ``UnitConversionError``.
+
     """
-    h = h.to(u.au).value
-    eta_fov = eta_fov.to(u.rad).value
-    eta_center = eta_center.to(u.rad).value
-    beta = beta.to(u.rad).value
-    phi_nadir = phi_nadir.to(u.rad).value
-    lambda_nadir = lambda_nadir.to(u.rad).value
-    R = R.to(u.au).value
+    h = h.to_value(u.au)
+    eta_fov = eta_fov.to_value(u.rad)
+    eta_center = eta_center.to_value(u.rad)
+    beta = beta.to_value(u.rad)
+    phi_nadir = phi_nadir.to_value(u.rad)
+    lambda_nadir = lambda_nadir.to_value(u.rad)
+    R = R.to_value(u.au)
 
     (delta_lambda, phi_tgt, lambda_tgt,) = ground_range_diff_at_azimuth_fast(
         h, eta_fov, eta_center, beta, phi_nadir, lambda_nadir, R
     )
 
-    return delta_lambda * u.rad, phi_tgt * u.rad, lambda_tgt * u.rad
+    return delta_lambda << u.rad, phi_tgt << u.rad, lambda_tgt << u.rad
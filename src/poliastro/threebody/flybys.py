@@ -3,13 +3,6 @@ from astropy import units as u
 from poliastro.core.flybys import compute_flyby as compute_flyby_fast
 
 
-@u.quantity_input(
-    v_spacecraft=u.au / u.s,
-    v_body=u.au / u.s,
-    k=u.au ** 3 / u.s ** 2,
-    r_p=u.au,
-    theta=u.deg,
-)
 def compute_flyby(v_spacecraft, v_body, k, r_p, theta=0 * u.deg):
     """Computes outbound velocity after a flyby.
 
@@ -33,13 +26,17 @@ def compute_flyby(v_spacecraft, v_body, k, r_p, theta=0 * u.deg):
     delta : ~astropy.units.Quantity
         Turn angle.
 
+    Notes
+    -----
+    Plain numbers raise ``AttributeError`` and wrong units ``UnitConversionError``.
+
     """
-    v_spacecraft = v_spacecraft.to(u.au / u.s).value
-    v_body = v_body.to(u.au / u.s).value
-    k = k.to(u.au ** 3 / u.s ** 2).value
-    r_p = r_p.to(u.au).value
-    theta = theta.to(u.rad).value
+    v_spacecraft = v_spacecraft.to_value(u.au / u.s)
+    v_body = v_body.to_value(u.au / u.s)
+    k = k.to_value(u.au ** 3 / u.s ** 2)
+    r_p = r_p.to_value(u.au)
+    theta = theta.to_value(u.rad)
 
     v_spacecraft_out, delta = compute_flyby_fast(v_spacecraft, v_body, k, r_p, theta)
 
-    return v_spacecraft_out * u.au / u.s, delta * u.rad
+    return v_spacecraft_out << u.au / u.s, delta << u.rad
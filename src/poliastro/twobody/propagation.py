@@ -59,6 +59,8 @@ def cowell(k, r, v, tofs, rtol=1e-11, *, events=None, f=func_twobody):
         returns <= 0., assuming you set events.terminal=True
     f : function(t0, u, k), optional
         Objective function, default to Keplerian-only forces.
+        Any callable ``f(t0, u, k)``, including a jitted function with extra
+        arguments bound via :py:func:`functools.partial`.
 
     Returns
     -------
@@ -5,3 +5,11 @@ from astropy.time import Time
 @pytest.fixture
 def earth_perihelion():
     return Time("2020-01-05 07:47:00", scale="tdb")
+
+
+@pytest.fixture(scope="session")
+def coesa76():
+    # Imported here so that a broken atmosphere package only affects its users
+    from poliastro.earth.atmosphere import COESA76
+
+    return COESA76()
@@ -4,15 +4,14 @@ from astropy import units as u
 
 from poliastro.bodies import Earth, Mars
 from poliastro.earth import EarthSatellite
-from poliastro.earth.atmosphere import COESA76
 from poliastro.earth.enums import EarthGravity
 from poliastro.spacecraft import Spacecraft
 from poliastro.twobody.orbit import Orbit
 
 
 def test_earth_satellite_orbit():
-    r = [3_539.08827417, 5_310.19903462, 3_066.31301457] * u.au
-    v = [-6.49780849, 3.24910291, 1.87521413] * u.au / u.s
+    r = [3_539.08827417, 5_310.19903462, 3_066.31301457] << u.au
+    v = [-6.49780849, 3.24910291, 1.87521413] << u.au / u.s
     ss = Orbit.from_vectors(Earth, r, v)
     C_D = 2.2 * u.one  # Dimensionless (any value would do)
     A = ((np.pi / 4.0) * (u.m ** 2)).to(u.au ** 2)
@@ -23,8 +22,8 @@ def test_earth_satellite_orbit():
 
 
 def test_orbit_attractor():
-    r = [3_539.08827417, 5_310.19903462, 3_066.31301457] * u.au
-    v = [-6.49780849, 3.24910291, 1.87521413] * u.au / u.s
+    r = [3_539.08827417, 5_310.19903462, 3_066.31301457] << u.au
+    v = [-6.49780849, 3.24910291, 1.87521413] << u.au / u.s
     ss = Orbit.from_vectors(Mars, r, v)
     C_D = 2.2 * u.one  # Dimensionless (any value would do)
     A = ((np.pi / 4.0) * (u.m ** 2)).to(u.au ** 2)
@@ -35,7 +34,7 @@ def test_orbit_attractor():
     assert "The attractor must be Earth" in excinfo.exconly()
 
 
-def test_propagate_instance():
+def test_propagate_instance(coesa76):
     tof = 1.0 * u.min
     ss0 = Orbit.from_classical(
         Earth,
@@ -54,7 +53,7 @@ def test_propagate_instance():
     orbit_with_j2 = earth_satellite.propagate(tof=tof, gravity=EarthGravity.J2)
     orbit_without_perturbation = earth_satellite.propagate(tof)
     orbit_with_atmosphere_and_j2 = earth_satellite.propagate(
-        tof=tof, gravity=EarthGravity.J2, atmosphere=COESA76()
+        tof=tof, gravity=EarthGravity.J2, atmosphere=coesa76
     )
     assert isinstance(orbit_with_j2, EarthSatellite)
     assert isinstance(orbit_with_atmosphere_and_j2, EarthSatellite)
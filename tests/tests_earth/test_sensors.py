@@ -112,3 +112,17 @@ def test_exception_ground_range_diff_at_azimuth(
             h, eta_center, eta_fov, beta, phi_nadir, lambda_nadir, R
         )
     assert "beta must be between 0º and 180º" in excinfo.exconly()
+
+
+def test_min_and_max_ground_range_wrong_unit_raises():
+    R = Earth.R.to(u.au)
+    with pytest.raises(u.UnitConversionError):
+        min_and_max_ground_range(800 * u.s, 25 * u.deg, 40 * u.deg, R)
+
+
+def test_ground_range_diff_at_azimuth_wrong_unit_raises():
+    R = Earth.R.to(u.au)
+    with pytest.raises(u.UnitConversionError):
+        ground_range_diff_at_azimuth(
+            800 * u.au, 40 * u.deg, 25 * u.deg, 140 * u.m, 50 * u.deg, 40 * u.deg, R
+        )
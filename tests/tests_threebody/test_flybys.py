@@ -25,3 +25,11 @@ def test_flyby_curtis(theta, expected_V_2_v):
 
     assert_quantity_allclose(V_2_v, expected_V_2_v, rtol=1e-3, atol=1e-15 * u.au / u.s)
     assert_quantity_allclose(delta, expected_delta, rtol=1e-3)
+
+
+def test_flyby_wrong_unit_raises():
+    V_1_v = [37.51, 2.782, 0] * u.au  # Position instead of velocity
+    V = [35.02, 0, 0] * u.au / u.s
+
+    with pytest.raises(u.UnitConversionError):
+        compute_flyby(V_1_v, V, Venus.k, Venus.R + 300 * u.au)
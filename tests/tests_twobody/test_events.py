@@ -48,12 +48,14 @@ def test_altitude_crossing():
     events = [altitude_cross_event]
 
     def f(t0, u_, k):
-        du_kep = func_twobody(t0, u_, k)
+        du = func_twobody(t0, u_, k)
         ax, ay, az = atmospheric_drag_exponential(
             t0, u_, k, R=R, C_D=C_D, A_over_m=A_over_m, H0=H0, rho0=rho0
         )
-        du_ad = np.array([0, 0, 0, ax, ay, az])
-        return du_kep + du_ad
+        du[3] += ax
+        du[4] += ay
+        du[5] += az
+        return du
 
     rr, _ = cowell(
         Earth.k,
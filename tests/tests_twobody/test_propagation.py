@@ -263,17 +263,28 @@ def test_apply_zero_maneuver_returns_equal_state():
     assert_allclose(orbit_new.v.to(u.au / u.s).value, ss.v.to(u.au / u.s).value)
 
 
+def test_func_twobody_gives_keplerian_acceleration():
+    k = Earth.k.to_value(u.au ** 3 / u.s ** 2)
+    r0 = np.array([1131.340, -2282.343, 6672.423])
+    v0 = np.array([-5.64305, 4.30333, 2.42879])
+
+    du = func_twobody(0.0, np.concatenate([r0, v0]), k)
+
+    assert_allclose(du[:3], v0)
+    assert_allclose(du[3:], -k * r0 / np.linalg.norm(r0) ** 3, rtol=1e-14)
+
+
 def test_cowell_propagation_with_zero_acceleration_equals_kepler():
     # Data from Vallado, example 2.4
 
-    r0 = np.array([1131.340, -2282.343, 6672.423]) * u.au
-    v0 = np.array([-5.64305, 4.30333, 2.42879]) * u.au / u.s
-    tofs = [40 * 60.0] * u.s
+    r0 = np.array([1131.340, -2282.343, 6672.423]) << u.au
+    v0 = np.array([-5.64305, 4.30333, 2.42879]) << u.au / u.s
+    tofs = [40 * 60.0] << u.s
 
     orbit = Orbit.from_vectors(Earth, r0, v0)
 
-    expected_r = np.array([-4219.7527, 4363.0292, -3958.7666]) * u.au
-    expected_v = np.array([3.689866, -1.916735, -6.112511]) * u.au / u.s
+    expected_r = np.array([-4219.7527, 4363.0292, -3958.7666]) << u.au
+    expected_v = np.array([3.689866, -1.916735, -6.112511]) << u.au / u.s
 
     r, v = cowell(Earth.k, orbit.r, orbit.v, tofs)
 
@@ -291,11 +302,12 @@ def test_cowell_propagation_circle_to_circle():
         return accel * v / norm_v
 
     def f(t0, u_, k):
-        du_kep = func_twobody(t0, u_, k)
+        du = func_twobody(t0, u_, k)
         ax, ay, az = constant_accel(t0, u_, k)
-        du_ad = np.array([0, 0, 0, ax, ay, az])
-
-        return du_kep + du_ad
+        du[3] += ax
+        du[4] += ay
+        du[5] += az
+        return du
 
     ss = Orbit.circular(Earth, 500 * u.au)
     tofs = [20] * ss.period
@@ -35,10 +35,12 @@ def test_leo_geo_numerical(inc_0):
 
     # Propagate orbit
     def f_leo_geo(t0, u_, k):
-        du_kep = func_twobody(t0, u_, k)
+        du = func_twobody(t0, u_, k)
         ax, ay, az = a_d(t0, u_, k)
-        du_ad = np.array([0, 0, 0, ax, ay, az])
-        return du_kep + du_ad
+        du[3] += ax
+        du[4] += ay
+        du[5] += az
+        return du
 
     sf = s0.propagate(t_f * u.s, method=cowell, f=f_leo_geo, rtol=1e-6)
 
@@ -80,10 +82,12 @@ def test_sso_disposal_numerical(ecc_0, ecc_f):
 
     # Propagate orbit
     def f_ss0_disposal(t0, u_, k):
-        du_kep = func_twobody(t0, u_, k)
+        du = func_twobody(t0, u_, k)
         ax, ay, az = a_d(t0, u_, k)
-        du_ad = np.array([0, 0, 0, ax, ay, az])
-        return du_kep + du_ad
+        du[3] += ax
+        du[4] += ay
+        du[5] += az
+        return du
 
     sf = s0.propagate(t_f * u.s, method=cowell, f=f_ss0_disposal, rtol=1e-8)
 
@@ -148,10 +152,12 @@ def test_geo_cases_numerical(ecc_0, ecc_f):
 
     # Propagate orbit
     def f_geo(t0, u_, k):
-        du_kep = func_twobody(t0, u_, k)
+        du = func_twobody(t0, u_, k)
         ax, ay, az = a_d(t0, u_, k)
-        du_ad = np.array([0, 0, 0, ax, ay, az])
-        return du_kep + du_ad
+        du[3] += ax
+        du[4] += ay
+        du[5] += az
+        return du
 
     sf = s0.propagate(t_f * u.s, method=cowell, f=f_geo, rtol=1e-8)
 
@@ -209,10 +215,12 @@ def test_soyuz_standard_gto_numerical():
 
     # Propagate orbit
     def f_soyuz(t0, u_, k):
-        du_kep = func_twobody(t0, u_, k)
+        du = func_twobody(t0, u_, k)
         ax, ay, az = a_d(t0, u_, k)
-        du_ad = np.array([0, 0, 0, ax, ay, az])
-        return du_kep + du_ad
+        du[3] += ax
+        du[4] += ay
+        du[5] += az
+        return du
 
     sf = s0.propagate(t_f * u.s, method=cowell, f=f_soyuz, rtol=1e-8)
 